@@ -0,0 +1,728 @@
+"""
+array_doubly_linked_list.py
+============================
+
+Author: Giuseppe Muschetta
+Email: g.muschetta@studenti.unipi.it
+Project: DoublyLinkedList Data Structure in Python
+University: University of Pisa – MSc in Computer Science,
+                                 Specialization in "Data Science and Business Informatics"
+License: MIT
+GitHub: https://github.com/peppe212/Pythonic-LinkedList-Abstraction
+
+Description:
+-------------
+This module defines the `ArrayDoublyLinkedList` class, an alternative
+implementation of the doubly linked list that does not allocate one `Node`
+object per element. Instead, it uses a "struct of arrays" layout:
+
+    - `info`: a Python list holding the value of every slot;
+    - `next` / `prev`: two parallel `array.array('q')` of slot indices,
+      where -1 plays the role of None;
+    - `free`: a stack of released slot indices, reused by later insertions.
+      When released slots come to outnumber the live ones, the arrays are
+      compacted, so their length stays proportional to the size of the list.
+
+A node is therefore just an integer index into these arrays. The links are
+stored as packed machine integers rather than as references between heap
+objects, which keeps the whole structure compact and lets several operations
+run at C speed:
+
+    - `from_python_list`, `sort` and `remove_duplicates` build the arrays
+      with contiguous links in one go;
+    - `reverse` merely swaps the `next` and `prev` arrays, in O(1).
+
+The public interface mirrors the one of `DoublyLinkedList`, with the same
+exceptions raised in the same situations.
+"""
+
+import operator
+from array import array
+
+# Shared with DoublyLinkedList, so that both variants reject None identically
+from doubly_linked_list import _validate_value
+
+# Slot index standing for "no node"
+_NIL = -1
+
+
+class ArrayDoublyLinkedList:
+    __slots__ = ("info", "next", "prev", "free", "head", "tail", "size")
+
+    # Below this many released slots, compacting the arrays is not worth it
+    _COMPACT_MIN_FREE = 64
+
+    def __init__(self):
+        self.info = []
+        self.next = array('q')
+        self.prev = array('q')
+        self.free = []
+        self.head = _NIL
+        self.tail = _NIL
+        self.size = 0
+
+    def _new_slot(self, value) -> int:
+        """
+        Returns a detached slot holding the given value, reusing a released
+        slot when available and growing the arrays otherwise.
+
+        Parameters:
+            value: The value to be stored in the slot.
+
+        Returns:
+            int: The index of the slot.
+        """
+        if self.free:
+            slot = self.free.pop()
+            self.info[slot] = value
+            self.next[slot] = _NIL
+            self.prev[slot] = _NIL
+        else:
+            slot = len(self.info)
+            self.info.append(value)
+            self.next.append(_NIL)
+            self.prev.append(_NIL)
+        return slot
+
+    def _unlink(self, slot):
+        """
+        Detaches a slot from the chain, releases it and updates the size.
+        If released slots then outnumber the live ones, the arrays are
+        compacted; the cost is amortized over the deletions that freed them.
+
+        Parameters:
+            slot (int): The index of the slot to be removed.
+
+        Returns:
+            None
+        """
+        prev_slot = self.prev[slot]
+        next_slot = self.next[slot]
+        if prev_slot == _NIL:
+            self.head = next_slot
+        else:
+            self.next[prev_slot] = next_slot
+        if next_slot == _NIL:
+            self.tail = prev_slot
+        else:
+            self.prev[next_slot] = prev_slot
+        self.info[slot] = None
+        self.free.append(slot)
+        self.size -= 1
+        if len(self.free) > self.size and len(self.free) >= self._COMPACT_MIN_FREE:
+            self._rebuild(self.to_python_list())
+
+    def _rebuild(self, values: list):
+        """
+        Replaces the content of the list with the given values, laid out in
+        contiguous slots (slot i holds the i-th value) with no released slots.
+
+        Parameters:
+            values (list): The values to be stored, already validated.
+
+        Returns:
+            None
+        """
+        n = len(values)
+        self.info = values
+        self.next = array('q', range(1, n + 1))
+        self.prev = array('q', range(-1, n - 1))
+        self.free = []
+        if n == 0:
+            self.head = _NIL
+            self.tail = _NIL
+        else:
+            self.next[n - 1] = _NIL
+            self.head = 0
+            self.tail = n - 1
+        self.size = n
+
+    def _find(self, value) -> int:
+        """
+        Returns the slot holding the first occurrence of a value, or -1.
+
+        Parameters:
+            value: The value to be searched.
+
+        Returns:
+            int: The index of the slot, or -1 if the value is not in the list.
+        """
+        info = self.info
+        nxt = self.next
+        slot = self.head
+        while slot != _NIL and info[slot] != value:
+            slot = nxt[slot]
+        return slot
+
+    def _get_node_at_position(self, position) -> int:
+        """
+        Retrieves the slot located at a specified zero-based position in the list,
+        walking from the head or from the tail, whichever is closer.
+
+        Parameters:
+            position (int): The position of the slot to retrieve.
+
+        Returns:
+            int: The index of the slot at the given position.
+
+        Raises:
+            TypeError: If the position is not an integer.
+            IndexError: If the position is out of bounds.
+        """
+        size = self.size
+        try:
+            position = operator.index(position)  # rejects floats and other non-integers
+            out_of_bounds = position < 0 or position >= size
+        except TypeError:
+            raise TypeError("Position must be an integer.") from None
+        if out_of_bounds:
+            raise IndexError(f"Position {position} is out of bounds for list of size {size}.")
+
+        if position > size // 2:
+            prv = self.prev
+            slot = self.tail
+            for _ in range(size - 1 - position):
+                slot = prv[slot]
+        else:
+            nxt = self.next
+            slot = self.head
+            for _ in range(position):
+                slot = nxt[slot]
+        return slot
+
+    def clear(self):
+        """
+        Removes all elements from the list, releasing the underlying arrays.
+
+        Returns:
+            None
+        """
+        self._rebuild([])
+
+    def insert_at_beginning(self, value):
+        """
+        Inserts the given value at the beginning of the list.
+
+        Parameters:
+            value: The value to be inserted into the list.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the provided value is None.
+        """
+        _validate_value(value)
+        slot = self._new_slot(value)
+        if self.head == _NIL:
+            self.tail = slot
+        else:
+            self.next[slot] = self.head
+            self.prev[self.head] = slot
+        self.head = slot
+        self.size += 1
+
+    def insert_at_end(self, value):
+        """
+        Inserts the given value at the end of the list.
+
+        Parameters:
+            value: The value to be inserted into the list.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the provided value is None.
+        """
+        _validate_value(value)
+        slot = self._new_slot(value)
+        if self.tail == _NIL:
+            self.head = slot
+        else:
+            self.prev[slot] = self.tail
+            self.next[self.tail] = slot
+        self.tail = slot
+        self.size += 1
+
+    def insert_after_node(self, target_value, new_value):
+        """
+        Inserts a new value immediately after the first occurrence of the target value.
+
+        Parameters:
+            target_value: The value after which the new value is to be inserted.
+            new_value: The value to be inserted.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the target value is not found or any of the values are None.
+        """
+        _validate_value(target_value)
+        _validate_value(new_value)
+        target = self._find(target_value)
+        if target == _NIL:
+            raise ValueError(f"{target_value} has not been found in the list")
+        slot = self._new_slot(new_value)
+        following = self.next[target]
+        self.prev[slot] = target
+        self.next[slot] = following
+        self.next[target] = slot
+        if following == _NIL:
+            self.tail = slot
+        else:
+            self.prev[following] = slot
+        self.size += 1
+
+    def insert_before_node(self, target_value, new_value):
+        """
+        Inserts a new value immediately before the first occurrence of the target value.
+
+        Parameters:
+            target_value: The value before which the new value is to be inserted.
+            new_value: The value to be inserted.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the target value is not found or any of the values are None.
+        """
+        _validate_value(target_value)
+        _validate_value(new_value)
+        target = self._find(target_value)
+        if target == _NIL:
+            raise ValueError(f"{target_value} has not been found in the list")
+        slot = self._new_slot(new_value)
+        preceding = self.prev[target]
+        self.next[slot] = target
+        self.prev[slot] = preceding
+        self.prev[target] = slot
+        if preceding == _NIL:
+            self.head = slot
+        else:
+            self.next[preceding] = slot
+        self.size += 1
+
+    def contains(self, value) -> bool:
+        """
+        Checks whether the specified value exists in the list, walking the
+        chain of live slots only.
+
+        Parameters:
+            value: The value to be searched in the list.
+
+        Returns:
+            bool: True if the value is found in the list, False otherwise.
+
+        Raises:
+            ValueError: If the provided value is None.
+        """
+        _validate_value(value)
+        return self._find(value) != _NIL
+
+    def delete_at_beginning(self):
+        """
+        Removes the first element from the list.
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: If the list is empty.
+        """
+        if self.size == 0:
+            raise RuntimeError("List must contain at least 1 value")
+        self._unlink(self.head)
+
+    def delete_at_end(self):
+        """
+        Removes the last element from the list.
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: If the list is empty.
+        """
+        if self.size == 0:
+            raise RuntimeError("List must contain at least 1 value")
+        self._unlink(self.tail)
+
+    def delete_value(self, value):
+        """
+        Deletes the first occurrence of the specified value from the list.
+
+        Parameters:
+            value: The value to be removed from the list.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the value does not exist in the list or is None.
+            RuntimeError: If the list is empty.
+        """
+        _validate_value(value)
+        if self.size == 0:
+            raise RuntimeError("List must not be empty to delete a specific value.")
+        slot = self._find(value)
+        if slot == _NIL:
+            raise ValueError(f"'{value}' does not exist in the list.")
+        self._unlink(slot)
+
+    def delete_at_position(self, position):
+        """
+        Deletes the element at the specified zero-based position.
+
+        Parameters:
+            position (int): The index of the element to be removed.
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: If the list is empty.
+            TypeError: If the position is not an integer.
+            IndexError: If the position is out of bounds.
+        """
+        if self.size == 0:
+            raise RuntimeError("List must contain at least 1 value to delete by position.")
+        self._unlink(self._get_node_at_position(position))
+
+    def get_size(self) -> int:
+        """
+        Retrieves the number of elements currently stored in the list.
+
+        Returns:
+            int: The number of elements in the list.
+        """
+        return self.size
+
+    def is_empty(self) -> bool:
+        """
+        Checks whether the list is empty.
+
+        Returns:
+            bool: True if the list contains no elements, False otherwise.
+        """
+        return self.size == 0
+
+    def to_python_list(self) -> list:
+        """
+        Converts the list into a standard Python list, preserving the order.
+
+        Returns:
+            list: A new list containing the values of the linked list.
+        """
+        result = [None] * self.size
+        info = self.info
+        nxt = self.next
+        slot = self.head
+        i = 0
+        while slot != _NIL:
+            result[i] = info[slot]
+            slot = nxt[slot]
+            i += 1
+        return result
+
+    @classmethod
+    def from_python_list(cls, python_list: list) -> "ArrayDoublyLinkedList":
+        """
+        Creates a new ArrayDoublyLinkedList by copying all elements from a
+        standard Python list, preserving their original order.
+
+        Parameters:
+            python_list (list): The input Python list.
+
+        Returns:
+            ArrayDoublyLinkedList: A new list populated with the given elements.
+
+        Raises:
+            TypeError: If the input is not a valid Python list.
+            ValueError: If the input contains None.
+        """
+        if not isinstance(python_list, list):
+            raise TypeError("Input must be a standard Python list.")
+        if any(item is None for item in python_list):
+            raise ValueError("Cannot insert None into the list.")
+        dll = cls()
+        dll._rebuild(python_list[:])
+        return dll
+
+    def reverse(self):
+        """
+        Reverses the list in place in O(1), by swapping the roles of the
+        `next` and `prev` arrays and of the head and tail slots.
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: If the list is empty.
+        """
+        if self.size == 0:
+            raise RuntimeError("List must not be empty")
+        self.next, self.prev = self.prev, self.next
+        self.head, self.tail = self.tail, self.head
+
+    def clone(self) -> "ArrayDoublyLinkedList":
+        """
+        Creates and returns a copy of the list, with a contiguous layout.
+
+        Returns:
+            ArrayDoublyLinkedList: A new instance containing the same elements.
+        """
+        clone_to_return = type(self)()
+        clone_to_return._rebuild(self.to_python_list())
+        return clone_to_return
+
+    def sort(self, reverse: bool = False) -> None:
+        """
+        Sorts the elements of the list in ascending order by default, or in
+        descending order if reverse=True. The arrays are rebuilt with a
+        contiguous layout, which also compacts away any released slot.
+
+        Parameters:
+            reverse (bool): If set to True, the list is sorted in descending order.
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: If the list is empty.
+            TypeError: If the list contains elements that cannot be compared
+                       with each other. The list is left unchanged.
+        """
+        if self.size == 0:
+            raise RuntimeError("Cannot sort: list is empty.")
+        python_list = self.to_python_list()
+        python_list.sort(reverse=reverse)
+        self._rebuild(python_list)
+
+    def remove_duplicates(self) -> None:
+        """
+        Removes all duplicate elements from the list, preserving only the first
+        occurrence of each value, and compacts the arrays. On an empty list
+        this is a no-op. Unhashable elements are handled by an equality-based
+        (quadratic) scan.
+
+        Returns:
+            None
+        """
+        if self.size <= 1:
+            return
+        python_list = self.to_python_list()
+        try:
+            unique = list(dict.fromkeys(python_list))
+        except TypeError:
+            unique = []
+            for item in python_list:
+                if item not in unique:
+                    unique.append(item)
+        if len(unique) != self.size:
+            self._rebuild(unique)
+
+    # STACK METHODS (LIFO)
+    # push(value): pushes a new element onto the top of the stack (end of the list).
+    # Bound directly to insert_at_end. Raises ValueError if the value is None.
+    push = insert_at_end
+
+    def pop(self):
+        """
+        Removes and returns the top (last) element of the stack.
+
+        Raises:
+            RuntimeError: If the stack is empty.
+        """
+        if self.size == 0:
+            raise RuntimeError("Stack must not be empty")
+        value = self.info[self.tail]
+        self._unlink(self.tail)
+        return value
+
+    def peek(self):
+        """
+        Returns (without removing) the top (last) element of the stack.
+
+        Raises:
+            RuntimeError: If the stack is empty.
+        """
+        if self.size == 0:
+            raise RuntimeError("Stack must not be empty")
+        return self.info[self.tail]
+
+    # QUEUE METHODS (FIFO)
+    # enqueue(value): inserts an element at the end of the queue (tail of the list).
+    # Bound directly to insert_at_end. Raises ValueError if the value is None.
+    enqueue = insert_at_end
+
+    def dequeue(self):
+        """
+        Removes and returns the front (first) element of the queue.
+
+        Raises:
+            RuntimeError: If the queue is empty.
+        """
+        if self.size == 0:
+            raise RuntimeError("Queue must not be empty")
+        value = self.info[self.head]
+        self._unlink(self.head)
+        return value
+
+    def peek_front(self):
+        """
+        Returns (without removing) the front (first) element of the queue.
+
+        Raises:
+            RuntimeError: If the queue is empty.
+        """
+        if self.size == 0:
+            raise RuntimeError("Queue must not be empty")
+        return self.info[self.head]
+
+    def peek_rear(self):
+        """
+        Returns (without removing) the rear (last) element of the queue.
+
+        Raises:
+            RuntimeError: If the queue is empty.
+        """
+        if self.size == 0:
+            raise RuntimeError("Queue must not be empty")
+        return self.info[self.tail]
+
+    def __eq__(self, other) -> bool:
+        """
+        Two lists are equal if they have the same size and contain the same
+        elements in the same order.
+
+        Parameters:
+            other (ArrayDoublyLinkedList): The list to compare with.
+
+        Returns:
+            bool: True if both lists are equal, False otherwise.
+            NotImplemented is returned for objects that are not an
+            ArrayDoublyLinkedList, letting Python fall back to the other
+            operand (and ultimately to an identity check).
+        """
+        if self is other:
+            return True
+        if not isinstance(other, ArrayDoublyLinkedList):
+            return NotImplemented
+        if self.size != other.size:
+            return False
+
+        info, nxt = self.info, self.next
+        other_info, other_next = other.info, other.next
+        slot = self.head
+        other_slot = other.head
+        # Sizes are equal, so both walks end on the same iteration
+        while slot != _NIL:
+            if info[slot] != other_info[other_slot]:
+                return False
+            slot = nxt[slot]
+            other_slot = other_next[other_slot]
+        return True
+
+    def equals_iterable(self, iterable) -> bool:
+        """
+        Checks whether the list holds the same elements, in the same order,
+        as an arbitrary iterable, streaming through both without copying.
+
+        Parameters:
+            iterable (Iterable): The sequence of values to compare with.
+
+        Returns:
+            bool: True if the two sequences match element-wise and have the
+                  same length, False otherwise.
+        """
+        info = self.info
+        nxt = self.next
+        slot = self.head
+        for item in iterable:
+            if slot == _NIL or info[slot] != item:
+                return False
+            slot = nxt[slot]
+        return slot == _NIL
+
+    def __str__(self):
+        """
+        Returns the list content as a native Python list string, joining the
+        element representations straight from the slot chain.
+        """
+        return "[" + ", ".join(map(repr, self)) + "]"
+
+    def __repr__(self):
+        """
+        Returns a string showing the type and size of the list.
+        """
+        return f"ArrayDoublyLinkedList(size={self.size})"
+
+    def __iter__(self):
+        """
+        Yields the values of the list from head to tail.
+        """
+        info = self.info
+        nxt = self.next
+        slot = self.head
+        while slot != _NIL:
+            yield info[slot]
+            slot = nxt[slot]
+
+    def __reversed__(self):
+        """
+        Yields the values of the list from tail to head.
+        """
+        info = self.info
+        prv = self.prev
+        slot = self.tail
+        while slot != _NIL:
+            yield info[slot]
+            slot = prv[slot]
+
+    def __setitem__(self, index: int, value):
+        """
+        Replaces the element at the specified index (negative indices allowed).
+
+        Raises:
+            TypeError: If the index is not an integer.
+            IndexError: If the index is out of bounds.
+            ValueError: If the provided value is None.
+        """
+        _validate_value(value)
+        self.info[self._get_node_at_position(self._normalize_index(index))] = value
+
+    def __getitem__(self, index: int):
+        """
+        Retrieves the element at the specified index (negative indices allowed).
+
+        Raises:
+            TypeError: If the index is not an integer.
+            IndexError: If the index is out of bounds.
+        """
+        return self.info[self._get_node_at_position(self._normalize_index(index))]
+
+    def _normalize_index(self, index) -> int:
+        """
+        Converts a possibly negative index into a position, checking bounds.
+        """
+        size = self.size
+        try:
+            position = operator.index(index)  # rejects floats and other non-integers
+        except TypeError:
+            raise TypeError(f"{index} must be an integer") from None
+        if position < 0:
+            position += size
+        if position < 0 or position >= size:
+            raise IndexError(f"{index} is out of bounds")
+        return position
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements currently stored in the list.
+        """
+        return self.size
+
+    __contains__ = contains
@@ -22,7 +22,7 @@ This implementation is modularized for clarity and maintainability,
 with the `Node` class defined separately in `node.py`.
 
 Compatibility:
-    - Python 3.10+
+    - Python 3.10+ (CPython and PyPy)
 
 Usage:
     - Intended for educational and academic use within structured data manipulation.
@@ -30,27 +30,170 @@ Usage:
 """
 
 
+import operator
+
 # Import the Node class from the node module
 from node import Node
 
+
+# Defined at module level (rather than as a static method) so that each call
+# is a plain global lookup instead of an attribute lookup on the instance.
+def _validate_value(value):
+    if value is None:
+        raise ValueError("Cannot insert None into the list.")
+
+
 class DoublyLinkedList:
-    def __init__(self):
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ("head", "tail", "size", "_hash_index", "_index", "_finger")
+
+    # Below this size a linear scan beats maintaining the hash index
+    _HASH_INDEX_MIN_SIZE = 32
+
+    def __init__(self, hash_index: bool = False):
+        """
+        Initializes an empty list.
+
+        Parameters:
+            hash_index (bool): If set to True, the list maintains an auxiliary
+                               dictionary mapping each value to the nodes that
+                               hold it, making membership tests O(1) at the cost
+                               of extra memory. The index is only built by the
+                               first lookup on a list of at least
+                               _HASH_INDEX_MIN_SIZE elements, and it is silently
+                               dropped for good (falling back to linear scans) as
+                               soon as an unhashable value is stored.
+                               Note that dictionary lookups match a stored object
+                               by identity before equality, while linear scans use
+                               equality only: a value that is not equal to itself
+                               (such as float('nan')) is found by `contains()` and
+                               `delete_value()` only once the index is built.
+                               Defaults to False.
+        """
         self.head = None
         self.tail = None
         self.size = 0
+        self._hash_index = hash_index
+        # value -> the node holding it or, for a value stored more than once, an
+        # insertion-ordered dict of its nodes (used as a set, so that a node is
+        # unregistered in O(1)); None while the index is not built
+        self._index = None
+        # Last node reached by position, as a (position, node) pair, or None
+        self._finger = None
 
+    def _index_add(self, node):
+        """
+        Registers a node in the hash index under its current value.
+        A value held by a single node maps to the bare node; it is promoted to
+        a dict of nodes on its second occurrence. If the value is unhashable,
+        the index is dropped altogether.
 
-    @staticmethod
-    def _validate_value(value):
-        if value is None:
-            raise ValueError("Cannot insert None into the list.")
+        Parameters:
+            node (Node): The node to be registered.
+
+        Returns:
+            None
+        """
+        index = self._index
+        try:
+            held = index.setdefault(node.info, node)
+        except TypeError:
+            self._index = None
+            self._hash_index = False
+            return
+        if held is node:
+            return
+        if isinstance(held, dict):
+            held[node] = None
+        else:
+            index[node.info] = {held: None, node: None}
+
+    def _index_remove(self, node):
+        """
+        Removes a node from the hash index, deleting the entry for its value
+        when no other node holds it and demoting it back to a bare node when
+        a single one is left.
+
+        Parameters:
+            node (Node): The node to be unregistered.
+
+        Returns:
+            None
+        """
+        index = self._index
+        held = index[node.info]
+        if held is node:
+            del index[node.info]
+        else:
+            del held[node]
+            if len(held) == 1:
+                index[node.info] = next(iter(held))
+
+    def _lookup_index(self):
+        """
+        Returns the hash index to be used for a lookup, building it first if
+        it was requested and the list has grown large enough to benefit from it.
+
+        Returns:
+            dict or None: The hash index, or None if lookups must scan the list.
+        """
+        if self._index is None and self._hash_index and self.size >= self._HASH_INDEX_MIN_SIZE:
+            self._rebuild_index()
+        return self._index
+
+    def _rebuild_index(self):
+        """
+        Rebuilds the hash index from scratch by walking the list once.
+        Used after operations that rewrite node values in bulk.
+
+        Returns:
+            None
+        """
+        self._index = {}
+        current = self.head
+        while current is not None and self._index is not None:
+            self._index_add(current)
+            current = current.next
+
+    def _link_values(self, values):
+        """
+        Populates an empty list with the given values, in order.
+
+        All the nodes are created in one bulk pass and then stitched together
+        pairwise, instead of paying one insert_at_end call (with its validation
+        and empty-list checks) per element. Values are assumed to be valid
+        (i.e. not None).
+
+        Parameters:
+            values (Iterable): The values to be stored in the list.
+
+        Returns:
+            None
+        """
+        nodes = list(map(Node, values))
+        if not nodes:
+            return
+        successors = iter(nodes)
+        next(successors)
+        for node, successor in zip(nodes, successors):
+            node.next = successor
+            successor.prev = node
+        self.head = nodes[0]
+        self.tail = nodes[-1]
+        self.size = len(nodes)
+        self._finger = None
+        if self._index is not None:
+            self._rebuild_index()
 
     def _get_node_at_position(self, position):
         """
         Retrieves the node located at a specified zero-based position in the list.
 
-        The traversal is optimized: it starts from the head if the position is in
-        the first half of the list, or from the tail otherwise.
+        The traversal is optimized: it starts from whichever is closest among
+        the head, the tail, and the "finger", i.e. the node returned by the
+        previous lookup (unless the list has been structurally modified since).
+        Sequential access patterns such as `for i in range(n): dll[i]` thus
+        take O(1) per step instead of O(n).
 
         Parameters:
             position (int): The index of the node to retrieve.
@@ -62,23 +205,37 @@ class DoublyLinkedList:
             TypeError: If the position is not an integer.
             IndexError: If the position is out of bounds.
         """
-        if not isinstance(position, int):
-            raise TypeError("Position must be an integer.")
-
-        if position < 0 or position >= self.size:
-            raise IndexError(f"Position {position} is out of bounds for list of size {self.size}.")
-
-        current = self.head
+        size = self.size
+        try:
+            position = operator.index(position)  # rejects floats and other non-integers
+            out_of_bounds = position < 0 or position >= size
+        except TypeError:
+            raise TypeError("Position must be an integer.") from None
+        if out_of_bounds:
+            raise IndexError(f"Position {position} is out of bounds for list of size {size}.")
+
+        finger = self._finger
+        if finger is not None and abs(position - finger[0]) < min(position, size - 1 - position):
+            # Resume from the last visited node
+            current = finger[1]
+            steps = position - finger[0]
+            if steps > 0:
+                for _ in range(steps):
+                    current = current.next
+            else:
+                for _ in range(-steps):
+                    current = current.prev
         # Optimized traversal: if position is in the latter half, traverse from tail
-        if position > self.size // 2:
+        elif position > size // 2:
             current = self.tail
-            for _ in range(self.size - 1, position, -1):
+            for _ in range(size - 1 - position):
                 current = current.prev
         else:
+            current = self.head
             for _ in range(position):
                 current = current.next
 
-        assert current is not None, "Internal error: Node not found at valid positive position after traversal."
+        self._finger = (position, current)
         return current
 
     def clear(self):
@@ -94,8 +251,8 @@ class DoublyLinkedList:
         self.head = None
         self.tail = None
         self.size = 0
-        assert self.head is None and self.tail is None and self.size == 0, \
-            "Internal error: List not properly cleared."
+        self._finger = None
+        self._index = None  # rebuilt lazily by the next lookup on a large enough list
 
     def insert_at_beginning(self, value):
         """
@@ -113,8 +270,12 @@ class DoublyLinkedList:
         Raises:
             ValueError: If the provided value is None.
         """
-        self._validate_value(value)
+        if value is None:
+            raise ValueError("Cannot insert None into the list.")
         new_node = Node(value)
+        self._finger = None
+        if self._index is not None:
+            self._index_add(new_node)
         if self.head is None:
             self.head = new_node
             self.tail = new_node
@@ -141,8 +302,12 @@ class DoublyLinkedList:
         Raises:
             ValueError: If the provided value is None.
         """
-        self._validate_value(value)
+        if value is None:
+            raise ValueError("Cannot insert None into the list.")
         new_node = Node(value)
+        # Appending leaves every existing position unchanged: the finger stays valid
+        if self._index is not None:
+            self._index_add(new_node)
         if self.head is None:
             self.head = new_node
             self.tail = new_node
@@ -168,28 +333,25 @@ class DoublyLinkedList:
         Raises:
             ValueError: If the target value is not found or any of the values are None.
         """
-        self._validate_value(target_value)
-        self._validate_value(new_value)
-        if not self.contains(target_value):
-            raise ValueError(f"{target_value} has not been found in the list")
-        # Raggiungiamo il nodo contenente il target_value
+        _validate_value(target_value)
+        _validate_value(new_value)
+        # Raggiungiamo il nodo contenente il target_value con un'unica scansione
         current = self.head
-        on_target = False
-        while current and not on_target:
-            if current.info == target_value:
-                on_target = True
-            else:
-                current = current.next
+        while current is not None and current.info != target_value:
+            current = current.next
+        if current is None:
+            raise ValueError(f"{target_value} has not been found in the list")
         # Creo il nuovo nodo
         new_node = Node(new_value)
+        self._finger = None
+        if self._index is not None:
+            self._index_add(new_node)
         # Se target_value è l'ultimo nodo della lista
         if current.next is None:
-            assert (current == self.tail)
             self.tail.next = new_node
             new_node.prev = self.tail
             self.tail = new_node
         else:
-            assert (current.next is not None)
             new_node.next = current.next
             current.next.prev = new_node
             new_node.prev = current
@@ -202,7 +364,8 @@ class DoublyLinkedList:
         Checks whether the specified value exists in the list.
 
         Iterates through the list starting from the head to determine whether
-        any node contains the specified value.
+        any node contains the specified value. If the hash index is enabled,
+        the answer is found with a single dictionary lookup instead.
 
         Parameters:
             value: The value to be searched in the list.
@@ -213,16 +376,20 @@ class DoublyLinkedList:
         Raises:
             ValueError: If the provided value is None.
         """
-        self._validate_value(value)
+        _validate_value(value)
+        index = self._lookup_index()
+        if index is not None:
+            try:
+                return value in index
+            except TypeError:
+                pass  # unhashable probe: fall back to the linear scan
 
         current = self.head
-        found = False
-        while current and not found:
+        while current is not None:
             if current.info == value:
-                found = True
-            else:
-                current = current.next
-        return found
+                return True
+            current = current.next
+        return False
 
     def insert_before_node(self, target_value, new_value):
         """
@@ -239,28 +406,25 @@ class DoublyLinkedList:
         Raises:
             ValueError: If the target value is not found or any of the values are None.
         """
-        self._validate_value(target_value)
-        self._validate_value(new_value)
-        if not self.contains(target_value):
-            raise ValueError(f"{target_value} has not been found in the list")
-        # Raggiungiamo il nodo contenente il target_value
+        _validate_value(target_value)
+        _validate_value(new_value)
+        # Raggiungiamo il nodo contenente il target_value con un'unica scansione
         current = self.head
-        on_target = False
-        while current and not on_target:
-            if current.info == target_value:
-                on_target = True
-            else:
-                current = current.next
+        while current is not None and current.info != target_value:
+            current = current.next
+        if current is None:
+            raise ValueError(f"{target_value} has not been found in the list")
         # Creo il nuovo nodo
         new_node = Node(new_value)
+        self._finger = None
+        if self._index is not None:
+            self._index_add(new_node)
         # Se target_value è il primo nodo della lista
         if current.prev is None:
-            assert (current == self.head)
             self.head.prev = new_node
             new_node.next = self.head
             self.head = new_node
         else:
-            assert (current.prev is not None)
             current.prev.next = new_node
             new_node.prev = current.prev
             new_node.next = current
@@ -282,10 +446,11 @@ class DoublyLinkedList:
         Raises:
             RuntimeError: If the list is empty.
         """
-        if self.head is None or self.size == 0:
+        if self.size == 0:
             raise RuntimeError("List must contain at least 1 value")
 
-        if self.get_size() == 1:
+        old_head = self.head
+        if self.size == 1:
             self.head = self.head.next  #e quindi va a None
             self.tail = None
         else:
@@ -293,6 +458,9 @@ class DoublyLinkedList:
             self.head.prev = None
 
         self.size -= 1
+        self._finger = None
+        if self._index is not None:
+            self._index_remove(old_head)
         return
 
     def delete_at_end(self):
@@ -308,10 +476,11 @@ class DoublyLinkedList:
         Raises:
             RuntimeError: If the list is empty.
         """
-        if self.head is None or self.tail is None or self.size == 0:
+        if self.size == 0:
             raise RuntimeError("List must contain at least 1 value")
     
-        if self.get_size() == 1:
+        old_tail = self.tail
+        if self.size == 1:
             self.head = self.head.next  #e quindi va a None
             self.tail = None
         # Se la lista contiene più di 1 elemento, quindi da 2 elementi in poi
@@ -320,6 +489,9 @@ class DoublyLinkedList:
             self.tail.next = None
         # aggiorno size
         self.size -= 1
+        self._finger = None
+        if self._index is not None:
+            self._index_remove(old_tail)
         return
 
     def delete_value(self, value):
@@ -339,50 +511,86 @@ class DoublyLinkedList:
             ValueError: If the value does not exist in the list or is None.
             RuntimeError: If the list is empty.
         """
-        self._validate_value(value)
+        _validate_value(value)
         if self.head is None:
             raise RuntimeError("List must not be empty to delete a specific value.")
 
         current = self.head
-        found = False
-        while current and not found:
-            if current.info == value:
-                found = True
-            else:
+        held = None
+        index = self._lookup_index()
+        if index is not None:
+            try:
+                held = index.get(value)
+            except TypeError:
+                index = None  # unhashable probe: fall back to the linear scan
+        if index is None:
+            while current is not None and current.info != value:
+                current = current.next
+        elif held is None:
+            current = None  # the value is not in the list
+        elif isinstance(held, dict):
+            # Several nodes hold the value: the first one in list order is the
+            # first node of the chain that belongs to the indexed set
+            while current not in held:
                 current = current.next
+        else:
+            current = held  # the only occurrence is also the first one
 
-        if not found:
+        if current is None:
             raise ValueError(f"'{value}' does not exist in the list.")
 
-        if current.prev is None:  # This means 'current' is the head
-            self.delete_at_beginning()  # This already handles self.size -= 1
-        elif current.next is None:  # This means 'current' is the tail
-            self.delete_at_end()  # This already handles self.size -= 1
-        else:  # 'current' is a middle node
+        # Unlink 'current' in place: the node is already known, so there is no
+        # need to dispatch to delete_at_beginning/delete_at_end and re-check the list.
+        if current.prev is None:  # 'current' is the head
+            self.head = current.next
+        else:
             current.prev.next = current.next
+        if current.next is None:  # 'current' is the tail
+            self.tail = current.prev
+        else:
             current.next.prev = current.prev
-            self.size -= 1
+        self.size -= 1
+        self._finger = None
+        if self._index is not None:
+            self._index_remove(current)
 
     def delete_at_position(self, position):
         """
-        Deletes the element at the specified position.
-        # ... (docstring invariato)
+        Deletes the element at the specified zero-based position.
+
+        Adjusts the previous and next pointers of neighboring nodes (or the head
+        and tail references) to maintain list integrity after the removal.
+
+        Parameters:
+            position (int): The index of the element to be removed.
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: If the list is empty.
+            TypeError: If the position is not an integer.
+            IndexError: If the position is out of bounds.
         """
-        if self.head is None or self.size == 0:
+        if self.size == 0:
             raise RuntimeError("List must contain at least 1 value to delete by position.")
 
         # _get_node_at_position will now correctly handle out-of-bounds positions
         # with IndexError, since we've already handled the empty list case.
         current = self._get_node_at_position(position)
 
-        if current.prev is None:
-            self.delete_at_beginning()
-        elif current.next is None:
-            self.delete_at_end()
+        if current.prev is None:  # 'current' is the head
+            self.head = current.next
         else:
             current.prev.next = current.next
+        if current.next is None:  # 'current' is the tail
+            self.tail = current.prev
+        else:
             current.next.prev = current.prev
-            self.size -= 1
+        self.size -= 1
+        self._finger = None
+        if self._index is not None:
+            self._index_remove(current)
 
     def get_size(self) -> int:
         """
@@ -414,24 +622,25 @@ class DoublyLinkedList:
         Note:
             If the list is empty, an empty list is returned.
         """
-        if self.head is None or self.tail is None or self.size == 0:
-            return []
-
-        pythonic_list = []
+        # The size is known in advance: preallocate the slots instead of growing by append
+        pythonic_list = [None] * self.size
         current = self.head
-        while current:
-            pythonic_list.append(current.info)
+        i = 0
+        while current is not None:
+            pythonic_list[i] = current.info
             current = current.next
+            i += 1
 
-        assert (type(pythonic_list) is list)
         return pythonic_list
 
-    @staticmethod
-    def from_python_list(python_list: list) -> "DoublyLinkedList":
+    @classmethod
+    def from_python_list(cls, python_list: list) -> "DoublyLinkedList":
         """
         Creates a new DoublyLinkedList instance by copying all elements
         from a standard Python list, preserving their original order.
 
+        When called on a subclass, an instance of that subclass is returned.
+
         Parameters:
             python_list (list): The input Python list containing the elements
                                 to be inserted into the new doubly linked list.
@@ -441,15 +650,19 @@ class DoublyLinkedList:
                               provided Python list.
 
         Raises:
-            ValueError: If the input is not a valid Python list.
+            TypeError: If the input is not a valid Python list.
+            ValueError: If the input contains None.
         """
         if not isinstance(python_list, list):
             raise TypeError("Input must be a standard Python list.")
 
-        dll = DoublyLinkedList()
-        for item in python_list:
-            dll.insert_at_end(item)
+        # Validate everything up front, so that the chain can then be built
+        # without a per-element check
+        if any(item is None for item in python_list):
+            raise ValueError("Cannot insert None into the list.")
 
+        dll = cls()
+        dll._link_values(python_list)
         return dll
 
     def reverse(self):
@@ -473,15 +686,15 @@ class DoublyLinkedList:
         if self.head is None or self.tail is None or self.size == 0:
             raise RuntimeError("List must not be empty")
         current = self.head
-        while current:
-            temp = current.next
-            current.next = current.prev
-            current.prev = temp
+        while current is not None:
+            current.prev, current.next = current.next, current.prev
             current = current.prev
 
-        temp_final = self.head
-        self.head = self.tail
-        self.tail = temp_final
+        self.head, self.tail = self.tail, self.head
+        # The finger node is unchanged: only its position is mirrored
+        if self._finger is not None:
+            position, node = self._finger
+            self._finger = (self.size - 1 - position, node)
         return
 
     def clone(self) -> "DoublyLinkedList":
@@ -490,24 +703,22 @@ class DoublyLinkedList:
         replicating all nodes and values in the same order.
 
         Returns:
-            DoublyLinkedList: A new instance containing a deep copy
-            of all elements from the original list.
+            DoublyLinkedList: A new instance (of the same type as the original)
+            containing a deep copy of all elements from the original list.
         """
-        clone_to_return = DoublyLinkedList()
+        clone_to_return = type(self)(hash_index=self._hash_index)
         if self.head is None or self.tail is None or self.size == 0:
             return clone_to_return
-        current = self.head
-        while current:
-            clone_to_return.insert_at_end(current.info)
-            current = current.next
+        # Values stored in the list are already known to be valid
+        clone_to_return._link_values(self)
         return clone_to_return
 
     def sort(self, reverse: bool = False) -> None:
         """
         Sorts the elements of the list in ascending order by default,
         or in descending order if reverse=True. This method uses Python's
-        built-in sorting for optimal performance and reinserts the values
-        into the list in sorted order.
+        built-in sorting for optimal performance and writes the sorted values
+        back into the existing nodes, so no node is allocated or relinked.
 
         Parameters:
             reverse (bool): If set to True, the list is sorted in descending order.
@@ -515,22 +726,27 @@ class DoublyLinkedList:
 
         Returns:
             None
+
+        Raises:
+            RuntimeError: If the list is empty.
+            TypeError: If the list contains elements that cannot be compared
+                       with each other. The list is left unchanged.
         """
         if self.head is None or self.tail is None or self.size == 0:
-            print("Cannot sort: list is empty.")
-            return
+            raise RuntimeError("Cannot sort: list is empty.")
 
         python_list = self.to_python_list()
-        try:
-            python_list.sort(reverse=reverse)
-        except TypeError:
-            print("Cannot sort: the list contains elements that cannot be compared with each other.")
-            return
+        python_list.sort(reverse=reverse)
 
-        self.clear()
-        for item in python_list:
-            self.insert_at_end(item)
-        print("List sorted successfully." if not reverse else "List sorted in reverse order.")
+        # Overwrite the values in place, walking the existing node chain once
+        current = self.head
+        i = 0
+        while current is not None:
+            current.info = python_list[i]
+            current = current.next
+            i += 1
+        if self._index is not None:
+            self._rebuild_index()
         return
 
     def remove_duplicates(self) -> None:
@@ -538,43 +754,58 @@ class DoublyLinkedList:
         Removes all duplicate elements from the list, preserving only the first
         occurrence of each value. The order of remaining elements is preserved.
 
+        The unique values are written back into the leading nodes of the list
+        and the surplus nodes at the tail are unlinked, instead of rebuilding
+        the whole chain. On an empty list this is a no-op.
+
+        Duplicates are detected in linear time through hashing. If the list
+        contains unhashable elements, an equality-based (quadratic) scan is
+        used instead.
+
         Parameters: None
 
         Returns: None
         """
-        if self.head is None or self.tail is None or self.size == 0:
-            raise RuntimeError("List must not be empty")
+        if self.size <= 1:
+            return
+        index = self._lookup_index()
+        if index is not None and len(index) == self.size:
+            # Every value maps to a single node: there are no duplicates
+            return
         python_list = self.to_python_list()
-        # creo un insieme chiamato seen
-        seen = set()
-        result = []
-        for item in python_list:
-            if item not in seen:
-                seen.add(item)
-                result.append(item)
-
-        self.clear()
+        try:
+            # dict preserves insertion order, so its keys are the first occurrences in order
+            result = list(dict.fromkeys(python_list))
+        except TypeError:
+            result = []
+            for item in python_list:
+                if item not in result:
+                    result.append(item)
+
+        if len(result) == self.size:
+            # No duplicates found: nothing to do
+            return
+
+        current = self.head
         for item in result:
-            self.insert_at_end(item)
+            current.info = item
+            current = current.next
+
+        # 'current' is now the first surplus node: cut the chain just before it
+        self.tail = current.prev
+        self.tail.next = None
+        self.size = len(result)
+        self._finger = None
+        if self._index is not None:
+            self._rebuild_index()
         return
 
     # STACK METHODS (LIFO)
     # This means you can use this DoublyLinkedList as a Stack
-    def push(self, value) -> None:
-        """
-        Pushes a new element onto the top of the stack (end of the list).
-
-        Parameters:
-            value: The value to be inserted into the list.
-
-        Returns:
-            None
-
-        Raises:
-            ValueError: If the provided value is None.
-        """
-        self.insert_at_end(value)
-        return
+    # push(value): pushes a new element onto the top of the stack (end of the list).
+    # Bound directly to insert_at_end, so no wrapper call is paid per operation.
+    # Raises ValueError if the provided value is None.
+    push = insert_at_end
 
     def pop(self):
         """
@@ -586,19 +817,21 @@ class DoublyLinkedList:
         Raises:
             RuntimeError: If the list (stack) is empty.
         """
-        if not self.head or not self.tail or self.size == 0:
+        if self.size == 0:
             raise RuntimeError("Stack must not be empty")
+        old_tail = self.tail
+        value = old_tail.info
         if self.size == 1:
-            value = self.head.info
-            assert(value == self.tail.info)
-            self.clear() 
-            return value
+            self.head = None
+            self.tail = None
         else:
-            value = self.tail.info
-            self.tail = self.tail.prev
+            self.tail = old_tail.prev
             self.tail.next = None
-            self.size -= 1
-            return value
+        self.size -= 1
+        self._finger = None
+        if self._index is not None:
+            self._index_remove(old_tail)
+        return value
 
 
     def peek(self):
@@ -611,7 +844,7 @@ class DoublyLinkedList:
         Raises:
             RuntimeError: If the list (stack) is empty.
         """
-        if not self.head or not self.tail or self.size == 0:
+        if self.size == 0:
             raise RuntimeError("Stack must not be empty")
         value = self.tail.info
         return value
@@ -619,21 +852,10 @@ class DoublyLinkedList:
 
     # QUEUE METHODS (FIFO)
     # This means you can use this DoublyLinkedList as a Queue
-    def enqueue(self, value) -> None:
-        """
-        Inserts an element at the end of the queue (tail of the list).
-
-        Parameters:
-            value: The value to be enqueued.
-
-        Returns:
-            None
-
-        Raises:
-            ValueError: If the provided value is None.
-        """
-        self.insert_at_end(value)
-        return
+    # enqueue(value): inserts an element at the end of the queue (tail of the list).
+    # Like push, it is bound directly to insert_at_end.
+    # Raises ValueError if the provided value is None.
+    enqueue = insert_at_end
 
     def dequeue(self):
         """
@@ -645,16 +867,20 @@ class DoublyLinkedList:
         Raises:
             RuntimeError: If the queue (list) is empty.
         """
-        if not self.head or not self.tail or self.size == 0:
+        if self.size == 0:
             raise RuntimeError("Queue must not be empty")
-        value = self.head.info
+        old_head = self.head
+        value = old_head.info
         if self.size == 1:
-            self.clear()  # This sets self.size = 0
+            self.head = None
+            self.tail = None
         else:
-            self.head = self.head.next
+            self.head = old_head.next
             self.head.prev = None
-            self.size -= 1  # <--- MOVE IT HERE
-        # REMOVE self.size -= 1 from here
+        self.size -= 1
+        self._finger = None
+        if self._index is not None:
+            self._index_remove(old_head)
         return value
 
     def peek_front(self):
@@ -667,7 +893,7 @@ class DoublyLinkedList:
         Raises:
             RuntimeError: If the queue (list) is empty.
         """
-        if not self.head or not self.tail or self.size == 0:
+        if self.size == 0:
             raise RuntimeError("Queue must not be empty")
         return self.head.info
 
@@ -681,7 +907,7 @@ class DoublyLinkedList:
         Raises:
             RuntimeError: If the queue (list) is empty.
         """
-        if not self.head or not self.tail or self.size == 0:
+        if self.size == 0:
             raise RuntimeError("Queue must not be empty")
         return self.tail.info
 
@@ -696,9 +922,15 @@ class DoublyLinkedList:
 
             Returns:
                 bool: True if both lists are equal, False otherwise.
+                NotImplemented is returned for objects that are not a
+                DoublyLinkedList, letting Python fall back to the other
+                operand (and ultimately to an identity check).
             """
+        if self is other:
+            return True
+
         if not isinstance(other, DoublyLinkedList):
-            return False
+            return NotImplemented
 
         if self.size != other.size:
             return False
@@ -706,23 +938,49 @@ class DoublyLinkedList:
         current_self = self.head
         current_other = other.head
 
-        while current_self and current_other:
+        # Sizes are equal, so both walks end on the same iteration
+        while current_self is not None:
             if current_self.info != current_other.info:
                 return False
             current_self = current_self.next
             current_other = current_other.next
         return True
 
+    def equals_iterable(self, iterable) -> bool:
+        """
+        Checks whether the list holds the same elements, in the same order,
+        as an arbitrary iterable (a Python list, a tuple, a generator, ...).
+
+        The comparison streams through both sides at once: no intermediate
+        list is built, and it stops at the first mismatch.
+
+        Parameters:
+            iterable (Iterable): The sequence of values to compare with.
+
+        Returns:
+            bool: True if the two sequences match element-wise and have the
+                  same length, False otherwise.
+        """
+        current = self.head
+        for item in iterable:
+            if current is None or current.info != item:
+                return False
+            current = current.next
+        return current is None
+
 
     def __str__(self):
         """
         Returns a human-readable string representation of the list content,
         showing elements in forward order as a native Python list.
 
+        The element representations are joined straight from the node chain,
+        without first materializing the values into an intermediate list.
+
         Returns:
             str: The list content as a string.
         """
-        return str(self.to_python_list())
+        return "[" + ", ".join(map(repr, self)) + "]"
 
     def __repr__(self):
         """
@@ -752,7 +1010,7 @@ class DoublyLinkedList:
             None
         """
         current = self.head
-        while current:
+        while current is not None:
             yield current.info
             current = current.next
 
@@ -773,7 +1031,7 @@ class DoublyLinkedList:
             None
         """
         current = self.tail
-        while current:
+        while current is not None:
             yield current.info
             current = current.prev
 
@@ -794,19 +1052,22 @@ class DoublyLinkedList:
             IndexError: If the index is out of the valid range (either positive or negative).
             ValueError: If the provided value is None (optional but recommended for data integrity).
         """
-        self._validate_value(value)
-        if not isinstance(index, int):
-            raise TypeError(f"{index} must be an integer")
-        if index < 0:
-            positive_index = index + self.size
-            if positive_index < 0:
-                raise IndexError(f"{index} is out of bounds")
-        else:
-            positive_index = index
-            if positive_index >= self.size:
-                raise IndexError(f"{index} is out of bounds")
+        _validate_value(value)
+        size = self.size
+        try:
+            position = operator.index(index)  # rejects floats and other non-integers
+        except TypeError:
+            raise TypeError(f"{index} must be an integer") from None
+        positive_index = position + size if position < 0 else position
+        if positive_index < 0 or positive_index >= size:
+            raise IndexError(f"{index} is out of bounds")
         node = self._get_node_at_position(positive_index)
-        node.info = value
+        if self._index is not None:
+            self._index_remove(node)
+            node.info = value
+            self._index_add(node)
+        else:
+            node.info = value
         return
 
 
@@ -825,16 +1086,14 @@ class DoublyLinkedList:
             TypeError: If the index is not an integer.
             IndexError: If the index is out of bounds.
         """
-        if not isinstance(index, int):
-            raise TypeError(f"{index} must be an integer")
-        if index < 0:
-            positive_index = index + self.size
-            if positive_index < 0:
-                raise IndexError(f"{index} is out of bounds")
-        else:
-            positive_index = index
-            if positive_index >= self.size:
-                raise IndexError(f"{index} is out of bounds")
+        size = self.size
+        try:
+            position = operator.index(index)  # rejects floats and other non-integers
+        except TypeError:
+            raise TypeError(f"{index} must be an integer") from None
+        positive_index = position + size if position < 0 else position
+        if positive_index < 0 or positive_index >= size:
+            raise IndexError(f"{index} is out of bounds")
         node = self._get_node_at_position(positive_index)
         return node.info
 
@@ -854,22 +1113,7 @@ class DoublyLinkedList:
         return self.size
 
 
-    def __contains__(self, value) -> bool:
-        """
-        Checks whether the specified value exists within the doubly linked list.
-
-        This method enables support for the `in` keyword in Python expressions
-        (e.g., `if value in dll:`), improving code readability and conciseness.
-
-        Parameters:
-            value: The element to be searched within the list.
-
-        Returns:
-            bool: True if the value exists in the list, False otherwise.
-
-        Raises:
-            ValueError: If the provided value is None.
-        """
-        return self.contains(value)
-
-
+    # Support for the `in` keyword (e.g., `if value in dll:`). The scan in
+    # contains() is bound directly, rather than wrapped, to spare one call frame
+    # per membership test. Raises ValueError if the provided value is None.
+    __contains__ = contains
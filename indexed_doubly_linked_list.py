@@ -0,0 +1,184 @@
+"""
+indexed_doubly_linked_list.py
+==============================
+
+Author: Giuseppe Muschetta
+Email: g.muschetta@studenti.unipi.it
+Project: DoublyLinkedList Data Structure in Python
+University: University of Pisa – MSc in Computer Science,
+                                 Specialization in "Data Science and Business Informatics"
+License: MIT
+GitHub: https://github.com/peppe212/Pythonic-LinkedList-Abstraction
+
+Description:
+-------------
+This module defines the `IndexedDoublyLinkedList` class, a `DoublyLinkedList`
+augmented with a lightweight index layer for fast positional access.
+
+Alongside the ordinary node chain, the list keeps a table of "anchor" nodes,
+one every `k` positions, where `k` is roughly log2(n). Positional lookups
+(`dll[i]`, `dll[i] = v`, `delete_at_position(i)`) jump straight to the anchor
+preceding the requested position and then walk at most `k - 1` links, instead
+of up to n/2 links as in the plain list.
+
+The anchor table is rebuilt lazily: any structural change (insertion, deletion,
+reversal, clearing) simply discards it, and the next positional lookup rebuilds
+it in a single O(n) pass. Value-only updates, such as `__setitem__` or `sort`,
+keep it valid. This makes the class a good fit for workloads that index into
+the list repeatedly between structural changes.
+
+The node chain itself is left untouched, so every other operation behaves
+exactly as in `DoublyLinkedList`.
+"""
+
+import operator
+
+from doubly_linked_list import DoublyLinkedList
+
+
+class IndexedDoublyLinkedList(DoublyLinkedList):
+    __slots__ = ("_anchors", "_anchor_step")
+
+    def __init__(self, hash_index: bool = False):
+        super().__init__(hash_index)
+        self._anchors = None
+        self._anchor_step = 1
+
+    def _rebuild_anchors(self):
+        """
+        Rebuilds the anchor table by walking the list once from the head,
+        recording one node every `_anchor_step` positions.
+
+        Returns:
+            None
+        """
+        step = max(1, self.size.bit_length())
+        anchors = []
+        current = self.head
+        i = 0
+        while current is not None:
+            if i % step == 0:
+                anchors.append(current)
+            current = current.next
+            i += 1
+        self._anchors = anchors
+        self._anchor_step = step
+
+    def _get_node_at_position(self, position):
+        """
+        Retrieves the node located at a specified zero-based position in the list.
+
+        The lookup jumps to the closest anchor (or to the tail, past the last
+        anchor) and walks forward or backward from there, so that at most
+        about half the anchor spacing is covered. The anchor table is rebuilt
+        first if a structural change has invalidated it.
+
+        Parameters:
+            position (int): The index of the node to retrieve.
+
+        Returns:
+            Node: The node at the given index.
+
+        Raises:
+            TypeError: If the position is not an integer.
+            IndexError: If the position is out of bounds.
+        """
+        size = self.size
+        try:
+            position = operator.index(position)  # rejects floats and other non-integers
+            out_of_bounds = position < 0 or position >= size
+        except TypeError:
+            raise TypeError("Position must be an integer.") from None
+        if out_of_bounds:
+            raise IndexError(f"Position {position} is out of bounds for list of size {size}.")
+
+        if self._anchors is None:
+            self._rebuild_anchors()
+        anchors = self._anchors
+        step = self._anchor_step
+        anchor_index, offset = divmod(position, step)
+        if offset > step // 2:
+            # The following anchor (or the tail) may be closer: walk back from it
+            if anchor_index + 1 < len(anchors):
+                current = anchors[anchor_index + 1]
+                backward = step - offset
+            else:
+                current = self.tail
+                backward = size - 1 - position
+            if backward < offset:
+                for _ in range(backward):
+                    current = current.prev
+                return current
+        current = anchors[anchor_index]
+        for _ in range(offset):
+            current = current.next
+        return current
+
+    # Every structural mutation discards the anchor table
+
+    def clear(self):
+        super().clear()
+        self._anchors = None
+
+    def insert_at_beginning(self, value):
+        super().insert_at_beginning(value)
+        self._anchors = None
+
+    def insert_at_end(self, value):
+        super().insert_at_end(value)
+        self._anchors = None
+
+    def insert_after_node(self, target_value, new_value):
+        super().insert_after_node(target_value, new_value)
+        self._anchors = None
+
+    def insert_before_node(self, target_value, new_value):
+        super().insert_before_node(target_value, new_value)
+        self._anchors = None
+
+    def delete_at_beginning(self):
+        super().delete_at_beginning()
+        self._anchors = None
+
+    def delete_at_end(self):
+        super().delete_at_end()
+        self._anchors = None
+
+    def delete_value(self, value):
+        super().delete_value(value)
+        self._anchors = None
+
+    def delete_at_position(self, position):
+        super().delete_at_position(position)
+        self._anchors = None
+
+    def reverse(self):
+        super().reverse()
+        self._anchors = None
+
+    def remove_duplicates(self) -> None:
+        super().remove_duplicates()
+        self._anchors = None
+
+    push = insert_at_end
+
+    def pop(self):
+        value = super().pop()
+        self._anchors = None
+        return value
+
+    enqueue = insert_at_end
+
+    def dequeue(self):
+        value = super().dequeue()
+        self._anchors = None
+        return value
+
+    def __repr__(self):
+        """
+        Returns a detailed representation of the IndexedDoublyLinkedList object.
+
+        Returns:
+            str: A string showing the type and size of the list.
+        """
+        return f"IndexedDoublyLinkedList(size={self.size})"
@@ -28,15 +28,31 @@ Description:
 
 """
 
+import operator
+
 from doubly_linked_list import DoublyLinkedList
+from indexed_doubly_linked_list import IndexedDoublyLinkedList
+from array_doubly_linked_list import ArrayDoublyLinkedList
 
 # Optional: colored terminal output for enhanced readability (Unix-compatible)
-def color(text, code):
-    return f"\033[{code}m{text}\033[0m"
+# Each style wraps the message in prebuilt escape sequences, with no per-call formatting
+_GREEN, _RED, _BLUE, _RESET = "\033[92m", "\033[91m", "\033[94m", "\033[0m"
+success = lambda msg: _GREEN + msg + _RESET  # Green
+error = lambda msg: _RED + msg + _RESET      # Red
+info = lambda msg: _BLUE + msg + _RESET      # Blue
+
+
+def expect_raises(exc_type, func, *args):
+    """
+    Calls func(*args) and returns the exception of type exc_type it raises,
+    so that negative tests fail loudly when no exception is raised at all.
+    """
+    try:
+        func(*args)
+    except exc_type as e:
+        return e
+    raise AssertionError(f"Expected {exc_type.__name__} was not raised.")
 
-success = lambda msg: color(msg, '92')  # Green
-error = lambda msg: color(msg, '91')    # Red
-info = lambda msg: color(msg, '94')     # Blue
 
 def main():
     """
@@ -51,7 +67,10 @@ def main():
     print(" 4. Stack and Queue behavior")
     print(" 5. Cloning, Sorting, Duplicate Removal")
     print(" 6. Magic methods and iteration")
-    print(" 7. Edge case and error management\n")
+    print(" 7. Edge case and error management")
+    print(" 8. Indexed variant with fast positional access")
+    print(" 9. Optional hash index for fast membership tests")
+    print("10. Array-backed variant (struct of arrays)\n")
     print("=== STARTING COMPREHENSIVE DOUBLY LINKED LIST TEST SUITE ===")
 
     # --- Test Initialization and Empty State ---
@@ -73,10 +92,8 @@ def main():
     dll.insert_at_beginning(30)
     print(f"After inserting 30: {dll} (Size: {dll.get_size()})")
     assert dll.to_python_list() == [30, 20, 10], "insert_at_beginning failed."
-    try:
-        dll.insert_at_beginning(None)
-    except ValueError as e:
-        print(f"Correctly caught error for inserting None at beginning: {e}")
+    e = expect_raises(ValueError, dll.insert_at_beginning, None)
+    print(f"Correctly caught error for inserting None at beginning: {e}")
 
 
     # --- Test insert_at_end ---
@@ -86,10 +103,8 @@ def main():
     dll.insert_at_end(15)
     print(f"After inserting 15: {dll} (Size: {dll.get_size()})")
     assert dll.to_python_list() == [30, 20, 10, 5, 15], "insert_at_end failed."
-    try:
-        dll.insert_at_end(None)
-    except ValueError as e:
-        print(f"Correctly caught error for inserting None at end: {e}")
+    e = expect_raises(ValueError, dll.insert_at_end, None)
+    print(f"Correctly caught error for inserting None at end: {e}")
 
     # --- Test contains ---
     print("\n--- 4. contains ---")
@@ -97,10 +112,8 @@ def main():
     print(f"Does list contain 100? {dll.contains(100)}")
     assert dll.contains(20) and not dll.contains(100), "contains failed."
     assert 20 in dll and not (100 in dll), "in operator (__contains__) failed."
-    try:
-        dll.contains(None)
-    except ValueError as e:
-        print(f"Correctly caught error for contains(None): {e}")
+    e = expect_raises(ValueError, dll.contains, None)
+    print(f"Correctly caught error for contains(None): {e}")
 
 
     # --- Test insert_after_node ---
@@ -113,14 +126,10 @@ def main():
         assert dll.to_python_list() == [30, 20, 25, 10, 5, 15, 1], "insert_after_node failed."
     except ValueError as e:
         print(f"Error during insert_after_node: {e}")
-    try:
-        dll.insert_after_node(99, 100) # Non-existent target
-    except ValueError as e:
-        print(f"Correctly caught error for inserting after non-existent node: {e}")
-    try:
-        dll.insert_after_node(20, None) # None as new_value
-    except ValueError as e:
-        print(f"Correctly caught error for inserting None value after node: {e}")
+    e = expect_raises(ValueError, dll.insert_after_node, 99, 100)  # Non-existent target
+    print(f"Correctly caught error for inserting after non-existent node: {e}")
+    e = expect_raises(ValueError, dll.insert_after_node, 20, None)  # None as new_value
+    print(f"Correctly caught error for inserting None value after node: {e}")
 
 
     # --- Test insert_before_node ---
@@ -133,14 +142,10 @@ def main():
         assert dll.to_python_list() == [35, 30, 20, 25, 8, 10, 5, 15, 1], "insert_before_node failed."
     except ValueError as e:
         print(f"Error during insert_before_node: {e}")
-    try:
-        dll.insert_before_node(99, 100) # Non-existent target
-    except ValueError as e:
-        print(f"Correctly caught error for inserting before non-existent node: {e}")
-    try:
-        dll.insert_before_node(20, None) # None as new_value
-    except ValueError as e:
-        print(f"Correctly caught error for inserting None value before node: {e}")
+    e = expect_raises(ValueError, dll.insert_before_node, 99, 100)  # Non-existent target
+    print(f"Correctly caught error for inserting before non-existent node: {e}")
+    e = expect_raises(ValueError, dll.insert_before_node, 20, None)  # None as new_value
+    print(f"Correctly caught error for inserting None value before node: {e}")
 
 
     # --- Test delete_at_beginning ---
@@ -152,11 +157,8 @@ def main():
         assert dll.get_size() == initial_size - 1, "delete_at_beginning size check failed."
     except RuntimeError as e:
         print(f"Error during delete_at_beginning: {e}")
-    try:
-        empty_dll_test = DoublyLinkedList()
-        empty_dll_test.delete_at_beginning()
-    except RuntimeError as e:
-        print(f"Correctly caught error for deleting from empty list (beginning): {e}")
+    e = expect_raises(RuntimeError, DoublyLinkedList().delete_at_beginning)
+    print(f"Correctly caught error for deleting from empty list (beginning): {e}")
 
 
     # --- Test delete_at_end ---
@@ -168,11 +170,8 @@ def main():
         assert dll.get_size() == initial_size - 1, "delete_at_end size check failed."
     except RuntimeError as e:
         print(f"Error during delete_at_end: {e}")
-    try:
-        empty_dll_test = DoublyLinkedList()
-        empty_dll_test.delete_at_end()
-    except RuntimeError as e:
-        print(f"Correctly caught error for deleting from empty list (end): {e}")
+    e = expect_raises(RuntimeError, DoublyLinkedList().delete_at_end)
+    print(f"Correctly caught error for deleting from empty list (end): {e}")
 
 
     # --- Test delete_value ---
@@ -191,15 +190,10 @@ def main():
         assert not dll.contains(30) and not dll.contains(1), "delete_value for head/tail failed."
     except (ValueError, RuntimeError) as e:
         print(f"Error during delete_value: {e}")
-    try:
-        dll.delete_value(999) # Non-existent value
-    except ValueError as e:
-        print(f"Correctly caught error for deleting non-existent value: {e}")
-    try:
-        dll_empty_for_delete_val = DoublyLinkedList()
-        dll_empty_for_delete_val.delete_value(1)
-    except RuntimeError as e:
-        print(f"Correctly caught error for deleting value from empty list: {e}")
+    e = expect_raises(ValueError, dll.delete_value, 999)  # Non-existent value
+    print(f"Correctly caught error for deleting non-existent value: {e}")
+    e = expect_raises(RuntimeError, DoublyLinkedList().delete_value, 1)
+    print(f"Correctly caught error for deleting value from empty list: {e}")
 
 
     # --- Test delete_at_position ---
@@ -224,23 +218,16 @@ def main():
             assert dll.get_size() == initial_size - 1, "delete_at_position (middle) size check failed."
     except (ValueError, RuntimeError, IndexError, TypeError) as e:
         print(f"Error during delete_at_position: {e}")
-    try:
-        dll.delete_at_position(99) # Out of bounds
-    except IndexError as e:
-        print(f"Correctly caught error for deleting at out-of-bounds position: {e}")
-    try:
-        dll.delete_at_position(-1) # Negative index
-    except IndexError as e:
-        print(f"Correctly caught error for deleting at negative position: {e}")
-    try:
-        dll.delete_at_position("abc") # Invalid type
-    except TypeError as e:
-        print(f"Correctly caught error for deleting with non-integer position: {e}")
-    try:
-        dll_empty_pos = DoublyLinkedList()
-        dll_empty_pos.delete_at_position(0) # Empty list
-    except RuntimeError as e:
-        print(f"Correctly caught error for deleting from empty list by position: {e}")
+    e = expect_raises(IndexError, dll.delete_at_position, 99)  # Out of bounds
+    print(f"Correctly caught error for deleting at out-of-bounds position: {e}")
+    e = expect_raises(IndexError, dll.delete_at_position, -1)  # Negative index
+    print(f"Correctly caught error for deleting at negative position: {e}")
+    e = expect_raises(TypeError, dll.delete_at_position, "abc")  # Invalid type
+    print(f"Correctly caught error for deleting with non-integer position: {e}")
+    e = expect_raises(TypeError, dll.delete_at_position, 1.5)  # Float position
+    assert str(e) == "Position must be an integer.", "delete_at_position float position failed."
+    e = expect_raises(RuntimeError, DoublyLinkedList().delete_at_position, 0)  # Empty list
+    print(f"Correctly caught error for deleting from empty list by position: {e}")
 
 
     # --- Test clear ---
@@ -262,11 +249,8 @@ def main():
         assert dll.to_python_list() == [4, 3, 2, 1], "reverse failed."
     except RuntimeError as e:
         print(f"Error during reverse: {e}")
-    try:
-        empty_dll = DoublyLinkedList()
-        empty_dll.reverse()
-    except RuntimeError as e:
-        print(f"Correctly caught error for reversing empty list: {e}")
+    e = expect_raises(RuntimeError, DoublyLinkedList().reverse)
+    print(f"Correctly caught error for reversing empty list: {e}")
 
 
     # --- Test clone ---
@@ -299,16 +283,10 @@ def main():
         assert sort_dll.to_python_list() == [50, 40, 30, 20, 10], "Descending sort failed."
     except (RuntimeError, TypeError) as e:
         print(f"Error during sort: {e}")
-    try:
-        empty_dll = DoublyLinkedList()
-        empty_dll.sort()
-    except RuntimeError as e:
-        print(f"Correctly caught error for sorting empty list: {e}")
-    try:
-        unsortable_dll = DoublyLinkedList.from_python_list([1, 'b', 3])
-        unsortable_dll.sort()
-    except TypeError as e:
-        print(f"Correctly caught error for sorting list with uncomparable types: {e}")
+    e = expect_raises(RuntimeError, DoublyLinkedList().sort)
+    print(f"Correctly caught error for sorting empty list: {e}")
+    e = expect_raises(TypeError, lambda: DoublyLinkedList.from_python_list([1, 'b', 3]).sort())
+    print(f"Correctly caught error for sorting list with uncomparable types: {e}")
 
 
     # --- Test remove_duplicates ---
@@ -327,11 +305,10 @@ def main():
         assert dup_dll.to_python_list() == [1, 2, 3, 4], "remove_duplicates failed."
     except RuntimeError as e:
         print(f"Error during remove_duplicates: {e}")
-    try:
-        empty_dll = DoublyLinkedList()
-        empty_dll.remove_duplicates()
-    except RuntimeError as e:
-        print(f"Correctly caught error for removing duplicates from empty list: {e}")
+    empty_dll = DoublyLinkedList()
+    empty_dll.remove_duplicates()
+    print(f"Removing duplicates from an empty list is a no-op: {empty_dll}")
+    assert empty_dll.is_empty(), "remove_duplicates on empty list failed."
 
 
     # --- Test Stack Methods (LIFO) ---
@@ -350,14 +327,10 @@ def main():
     print(f"Pop stack: {stack_dll.pop()}")
     print(f"Pop stack: {stack_dll.pop()}")
     print(f"Stack after all pops: {stack_dll} (Size: {stack_dll.get_size()})")
-    try:
-        stack_dll.pop()
-    except RuntimeError as e:
-        print(f"Correctly caught error for popping from empty stack: {e}")
-    try:
-        stack_dll.peek()
-    except RuntimeError as e:
-        print(f"Correctly caught error for peeking into empty stack: {e}")
+    e = expect_raises(RuntimeError, stack_dll.pop)
+    print(f"Correctly caught error for popping from empty stack: {e}")
+    e = expect_raises(RuntimeError, stack_dll.peek)
+    print(f"Correctly caught error for peeking into empty stack: {e}")
     stack_dll.push("X") # Add one element to test single element pop/peek
     print(f"Stack with one element: {stack_dll}")
     print(f"Pop single element: {stack_dll.pop()}")
@@ -383,18 +356,12 @@ def main():
     print(f"Dequeue queue: {queue_dll.dequeue()}")
     print(f"Dequeue queue: {queue_dll.dequeue()}")
     print(f"Queue after all dequeues: {queue_dll} (Size: {queue_dll.get_size()})")
-    try:
-        queue_dll.dequeue()
-    except RuntimeError as e:
-        print(f"Correctly caught error for dequeue from empty queue: {e}")
-    try:
-        queue_dll.peek_front()
-    except RuntimeError as e:
-        print(f"Correctly caught error for peeking front into empty queue: {e}")
-    try:
-        queue_dll.peek_rear()
-    except RuntimeError as e:
-        print(f"Correctly caught error for peeking rear into empty queue: {e}")
+    e = expect_raises(RuntimeError, queue_dll.dequeue)
+    print(f"Correctly caught error for dequeue from empty queue: {e}")
+    e = expect_raises(RuntimeError, queue_dll.peek_front)
+    print(f"Correctly caught error for peeking front into empty queue: {e}")
+    e = expect_raises(RuntimeError, queue_dll.peek_rear)
+    print(f"Correctly caught error for peeking rear into empty queue: {e}")
     queue_dll.enqueue("Single") # Add one element to test single element dequeue/peek
     print(f"Queue with one element: {queue_dll}")
     print(f"Dequeue single element: {queue_dll.dequeue()}")
@@ -424,6 +391,11 @@ def main():
     # Test equality with non-DoublyLinkedList object
     print(f"List1 == [1, 2]? {list1 == [1, 2]}")
     assert list1 != [1, 2], "__eq__ with non-DLL type failed."
+    # Element-wise comparison with any iterable, without converting the list
+    print(f"List1.equals_iterable([1, 2])? {list1.equals_iterable([1, 2])}")
+    assert list1.equals_iterable([1, 2]) and list1.equals_iterable(x for x in (1, 2)), "equals_iterable failed."
+    assert not list1.equals_iterable([1]) and not list1.equals_iterable([1, 2, 3]), "equals_iterable length check failed."
+    assert not list3.equals_iterable((1, 2)) and list4.equals_iterable(()), "equals_iterable failed."
 
 
     # --- Test __str__ and __repr__ ---
@@ -476,23 +448,35 @@ def main():
     print(f"Element at index 2: {getitem_dll[2]}")
     print(f"Element at last index ({len(getitem_dll)-1}): {getitem_dll[len(getitem_dll)-1]}")
     assert getitem_dll[0] == 10 and getitem_dll[2] == 30 and getitem_dll[len(getitem_dll)-1] == 50, "__getitem__ failed."
-    try:
-        print(f"Element at index 99: {getitem_dll[99]}") # Out of bounds
-    except IndexError as e:
-        print(f"Correctly caught error for __getitem__ out of bounds: {e}")
-    try:
-        print(f"Element at index -1: {getitem_dll[-1]}") # Negative index
-    except IndexError as e:
-        print(f"Correctly caught error for __getitem__ negative index: {e}") # Your _get_node_at_position throws IndexError directly
-    try:
-        print(f"Element at index 'a': {getitem_dll['a']}") # Invalid type
-    except TypeError as e:
-        print(f"Correctly caught error for __getitem__ invalid type: {e}")
-    try:
-        empty_dll = DoublyLinkedList()
-        var = empty_dll[0]  # Access empty list
-    except IndexError as e:
-        print(f"Correctly caught error for __getitem__ on empty list: {e}")
+    e = expect_raises(IndexError, lambda: getitem_dll[99])  # Out of bounds
+    print(f"Correctly caught error for __getitem__ out of bounds: {e}")
+    print(f"Element at index -1: {getitem_dll[-1]}")  # Negative indices count from the end
+    assert getitem_dll[-1] == 50 and getitem_dll[-5] == 10, "__getitem__ negative index failed."
+    e = expect_raises(TypeError, lambda: getitem_dll['a'])  # Invalid type
+    print(f"Correctly caught error for __getitem__ invalid type: {e}")
+    e = expect_raises(TypeError, lambda: getitem_dll[1.0])  # Float index
+    assert str(e) == "1.0 must be an integer", "__getitem__ float index failed."
+    e = expect_raises(IndexError, lambda: DoublyLinkedList()[0])  # Access empty list
+    print(f"Correctly caught error for __getitem__ on empty list: {e}")
+    # Sequential reads leave a cached "finger"; it must stay correct across structural changes
+    finger_dll = DoublyLinkedList.from_python_list(list(range(12)))
+    def positional_view():
+        # Start and end in the middle: only there do lookups resume from the finger
+        size = len(finger_dll)
+        middle = size // 2
+        values = {i: finger_dll[i] for i in list(range(middle, size)) + list(range(middle))}
+        finger_dll[middle]
+        return [values[i] for i in range(size)]
+    assert positional_view() == finger_dll.to_python_list(), "Sequential __getitem__ failed."
+    finger_dll.insert_at_beginning(-1)
+    assert positional_view() == finger_dll.to_python_list(), "__getitem__ after insert_at_beginning failed."
+    finger_dll.delete_at_position(5)
+    assert positional_view() == finger_dll.to_python_list(), "__getitem__ after delete_at_position failed."
+    finger_dll.reverse()
+    assert positional_view() == finger_dll.to_python_list(), "__getitem__ after reverse failed."
+    finger_dll.insert_at_end(99)
+    assert positional_view() == finger_dll.to_python_list(), "__getitem__ after insert_at_end failed."
+    print(f"Positional reads stay consistent across mutations: {finger_dll}")
 
 
     # --- Test __setitem__ (assignment by index) ---
@@ -504,27 +488,100 @@ def main():
     setitem_dll[len(setitem_dll)-1] = 'last'
     print(f"List after assignments: {setitem_dll}")
     assert setitem_dll.to_python_list() == ['first', 'b', 'middle', 'last'], "__setitem__ failed."
-    try:
-        setitem_dll[99] = 'error' # Out of bounds
-    except IndexError as e:
-        print(f"Correctly caught error for __setitem__ out of bounds: {e}")
-    try:
-        setitem_dll[-1] = 'error' # Negative index
-    except IndexError as e:
-        print(f"Correctly caught error for __setitem__ negative index: {e}")
-    try:
-        setitem_dll['a'] = 'error' # Invalid type
-    except TypeError as e:
-        print(f"Correctly caught error for __setitem__ invalid type: {e}")
-    try:
-        setitem_dll[0] = None # Set None value
-    except ValueError as e:
-        print(f"Correctly caught error for __setitem__ with None value: {e}")
-    try:
-        empty_dll = DoublyLinkedList()
-        empty_dll[0] = 'value' # Assign to empty list
-    except IndexError as e:
-        print(f"Correctly caught error for __setitem__ on empty list: {e}")
+    e = expect_raises(IndexError, operator.setitem, setitem_dll, 99, 'error')  # Out of bounds
+    print(f"Correctly caught error for __setitem__ out of bounds: {e}")
+    setitem_dll[-1] = 'tail'  # Negative indices count from the end
+    assert setitem_dll[3] == 'tail', "__setitem__ negative index failed."
+    e = expect_raises(TypeError, operator.setitem, setitem_dll, 'a', 'error')  # Invalid type
+    print(f"Correctly caught error for __setitem__ invalid type: {e}")
+    e = expect_raises(TypeError, operator.setitem, setitem_dll, 1.0, 'error')  # Float index
+    assert str(e) == "1.0 must be an integer", "__setitem__ float index failed."
+    e = expect_raises(ValueError, operator.setitem, setitem_dll, 0, None)  # Set None value
+    print(f"Correctly caught error for __setitem__ with None value: {e}")
+    e = expect_raises(IndexError, operator.setitem, DoublyLinkedList(), 0, 'value')  # Assign to empty list
+    print(f"Correctly caught error for __setitem__ on empty list: {e}")
+
+
+    # --- Test IndexedDoublyLinkedList ---
+    print("\n--- 24. IndexedDoublyLinkedList ---")
+    indexed_dll = IndexedDoublyLinkedList.from_python_list(list(range(100)))
+    print(f"Indexed list: {repr(indexed_dll)}")
+    print(f"Element at index 0: {indexed_dll[0]}")
+    print(f"Element at index 57: {indexed_dll[57]}")
+    print(f"Element at index -1: {indexed_dll[-1]}")
+    assert isinstance(indexed_dll, DoublyLinkedList), "IndexedDoublyLinkedList must be a DoublyLinkedList."
+    assert all(indexed_dll[i] == i for i in range(100)), "Indexed __getitem__ failed."
+    indexed_dll.delete_at_position(10)
+    indexed_dll.insert_at_beginning(-1)
+    indexed_dll[50] = 'fifty'
+    print(f"Elements at indices 49..51 after mutations: {indexed_dll[49]}, {indexed_dll[50]}, {indexed_dll[51]}")
+    expected = [-1] + [i for i in range(100) if i != 10]
+    expected[50] = 'fifty'
+    assert [indexed_dll[i] for i in range(len(indexed_dll))] == expected, "Indexed access after mutation failed."
+    assert indexed_dll.clone() == indexed_dll and isinstance(indexed_dll.clone(), IndexedDoublyLinkedList), \
+        "Indexed clone failed."
+    e = expect_raises(IndexError, lambda: indexed_dll[len(indexed_dll)])
+    print(f"Correctly caught error for indexed __getitem__ out of bounds: {e}")
+
+
+    # --- Test hash index ---
+    print("\n--- 25. Hash index (hash_index=True) ---")
+    hashed_dll = DoublyLinkedList(hash_index=True)
+    for value in [3, 1, 4, 1, 5, 9, 2, 6] + list(range(10, 50)): # Large enough to build the index
+        hashed_dll.insert_at_end(value)
+    print(f"Hash-indexed list: {repr(hashed_dll)}")
+    print(f"Does it contain 9? {9 in hashed_dll}")
+    print(f"Does it contain 7? {7 in hashed_dll}")
+    assert 9 in hashed_dll and 7 not in hashed_dll, "Hash-indexed contains failed."
+    hashed_dll.delete_value(1)
+    hashed_dll[0] = 7
+    hashed_dll.remove_duplicates()
+    print(f"After delete_value(1), [0] = 7, remove_duplicates(): {hashed_dll.to_python_list()[:10]}...")
+    assert hashed_dll.to_python_list() == [7, 4, 1, 5, 9, 2, 6] + list(range(10, 50)), "Hash-indexed mutations failed."
+    assert 7 in hashed_dll and 3 not in hashed_dll and 1 in hashed_dll, "Hash index out of sync after mutations."
+    # A value not equal to itself is only found through the index, which matches by identity first
+    nan = float('nan')
+    nan_dll = DoublyLinkedList(hash_index=True)
+    nan_dll.insert_at_end(nan)
+    assert nan not in nan_dll, "NaN must not be found by a linear scan."
+    for value in range(DoublyLinkedList._HASH_INDEX_MIN_SIZE):
+        nan_dll.insert_at_end(value)
+    assert nan in nan_dll, "NaN must be found by identity once the index is built."
+    nan_dll.delete_value(nan)
+    assert nan not in nan_dll and len(nan_dll) == DoublyLinkedList._HASH_INDEX_MIN_SIZE, "Indexed delete_value(NaN) failed."
+    hashed_dll.insert_at_end([0, 0]) # Unhashable value: falls back to linear scans
+    assert [0, 0] in hashed_dll and 9 in hashed_dll, "Hash index fallback for unhashable values failed."
+    print("Unhashable value inserted: membership falls back to a linear scan (correct).")
+
+
+    # --- Test ArrayDoublyLinkedList ---
+    print("\n--- 26. ArrayDoublyLinkedList ---")
+    array_dll = ArrayDoublyLinkedList.from_python_list([50, 10, 40, 10, 30])
+    print(f"Array-backed list: {array_dll} ({repr(array_dll)})")
+    array_dll.insert_at_beginning(60)
+    array_dll.delete_value(40)
+    array_dll.insert_after_node(10, 20)
+    print(f"After insert_at_beginning(60), delete_value(40), insert_after_node(10, 20): {array_dll}")
+    assert array_dll.to_python_list() == [60, 50, 10, 20, 10, 30], "Array-backed insert/delete failed."
+    assert 20 in array_dll and 40 not in array_dll, "Array-backed contains failed."
+    array_dll.reverse()
+    print(f"Reversed: {array_dll}")
+    assert array_dll.to_python_list() == [30, 10, 20, 10, 50, 60] and array_dll[-1] == 60, "Array-backed reverse failed."
+    array_dll.remove_duplicates()
+    array_dll.sort()
+    print(f"After remove_duplicates() and sort(): {array_dll}")
+    assert array_dll.equals_iterable([10, 20, 30, 50, 60]), "Array-backed sort/remove_duplicates failed."
+    assert not array_dll.equals_iterable([10, 20, 30, 50]), "Array-backed equals_iterable failed."
+    assert array_dll.pop() == 60 and array_dll.dequeue() == 10 and len(array_dll) == 3, "Array-backed stack/queue failed."
+    e = expect_raises(RuntimeError, ArrayDoublyLinkedList().delete_at_end)
+    print(f"Correctly caught error for deleting from empty array-backed list: {e}")
+    # Deleting most of a large list compacts the arrays once free slots dominate
+    array_dll = ArrayDoublyLinkedList.from_python_list(list(range(200)))
+    for _ in range(197):
+        array_dll.delete_at_beginning()
+    print(f"After deleting 197 of 200 elements: {array_dll} (backing slots: {len(array_dll.info)})")
+    assert array_dll.to_python_list() == [197, 198, 199] and len(array_dll) == 3, "Array-backed compaction lost values."
+    assert len(array_dll.info) < 200, "Array-backed storage was not compacted."
 
 
     print("\n=== ALL DOUBLY LINKED LIST TESTS COMPLETED SUCCESSFULLY! ===")